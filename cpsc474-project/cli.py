@@ -0,0 +1,145 @@
+# ===========================================================
+# CONNECT FOUR COMMAND LINE INTERFACE
+# -----------------------------------------------------------
+# Non-interactive entry point for headless runs:
+#   - evolve:  run the genetic algorithm (with checkpoint/resume)
+#   - compare: compare the Genetic AI and the Simple AI
+#   - play:    play and print a single AI game
+#   - bench:   time both AIs without printing any boards
+#
+# Game modules are imported inside each command and matplotlib
+# only when a plot is requested, so starting a worker stays cheap.
+# ===========================================================
+
+import argparse
+import sys
+import time
+
+
+# -----------------------------------------------------------
+# COMMANDS
+# -----------------------------------------------------------
+
+def cmd_evolve(args):
+    import random
+    from play_genetic import ConnectFour, evolve
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    game = ConnectFour()
+    best = evolve(
+        game,
+        generations=args.generations,
+        population_size=args.population,
+        mutation_rate=args.mutation_rate,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
+        plot=args.plot,
+        plot_file=args.plot_file,
+    )
+    print("Best evolved parameters:", best)
+    return 0
+
+
+def cmd_compare(args):
+    from connect4 import ConnectFourExtended
+
+    ConnectFourExtended().play(num_games=args.games)
+    return 0
+
+
+def cmd_play(args):
+    from connect4 import ConnectFourExtended
+
+    game = ConnectFourExtended()
+    if args.ai == 'genetic':
+        game.play_game_genetic(verbose=True)
+    else:
+        game.play_game_simple(verbose=True)
+    return 0
+
+
+def cmd_bench(args):
+    from connect4 import ConnectFourExtended
+
+    total_duration_genetic_algorithm = 0
+    total_duration_heuristic = 0
+    for _ in range(args.games):
+        start_time = time.perf_counter()
+        ConnectFourExtended().play_game_genetic(verbose=False)
+        total_duration_genetic_algorithm += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        ConnectFourExtended().play_game_simple(verbose=False)
+        total_duration_heuristic += time.perf_counter() - start_time
+
+    print("=== BENCHMARK RESULTS ===")
+    print(f"Games per AI:         {args.games}")
+    print(f"Avg. Time (Genetic):  {total_duration_genetic_algorithm / args.games * 1000:.2f}ms")
+    print(f"Avg. Time (Simple):   {total_duration_heuristic / args.games * 1000:.2f}ms")
+    return 0
+
+
+# -----------------------------------------------------------
+# ARGUMENT PARSING
+# -----------------------------------------------------------
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Connect Four Genetic Algorithm tools.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    evolve_parser = subparsers.add_parser('evolve', help="evolve heuristic weights")
+    evolve_parser.add_argument('--generations', type=positive_int, default=30)
+    evolve_parser.add_argument('--population', type=positive_int, default=10)
+    evolve_parser.add_argument('--mutation-rate', type=float, default=0.1)
+    evolve_parser.add_argument('--seed', type=int, default=None,
+                               help="seed the RNG (ignored when resuming from a checkpoint)")
+    evolve_parser.add_argument('--checkpoint', default=None,
+                               help="write a checkpoint to this path after every generation")
+    evolve_parser.add_argument('--resume', action='store_true',
+                               help="continue from --checkpoint if it exists")
+    evolve_parser.add_argument('--plot', action='store_true',
+                               help="show the fitness curve when done")
+    evolve_parser.add_argument('--plot-file', default=None,
+                               help="save the fitness curve to this image file")
+    evolve_parser.set_defaults(func=cmd_evolve)
+
+    compare_parser = subparsers.add_parser('compare', help="compare the Genetic and Simple AIs")
+    compare_parser.add_argument('--games', type=positive_int, default=10)
+    compare_parser.set_defaults(func=cmd_compare)
+
+    play_parser = subparsers.add_parser('play', help="play and print a single AI game")
+    play_parser.add_argument('--ai', choices=['genetic', 'simple'], default='genetic')
+    play_parser.set_defaults(func=cmd_play)
+
+    bench_parser = subparsers.add_parser('bench', help="time both AIs silently")
+    bench_parser.add_argument('--games', type=positive_int, default=10)
+    bench_parser.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'evolve':
+        if args.resume and args.checkpoint is None:
+            parser.error("--resume requires --checkpoint")
+        if args.population < 4:
+            parser.error("--population must be at least 4 (two parents are needed)")
+    return args.func(args)
+
+
+# -----------------------------------------------------------
+# MAIN ENTRY POINT
+# -----------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(main())
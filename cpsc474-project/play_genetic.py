@@ -13,8 +13,10 @@
 # ===========================================================
 
 import itertools
+import os
+import pickle
 import random
-import matplotlib.pyplot as plt
+import tempfile
 
 
 # -----------------------------------------------------------
@@ -191,6 +193,8 @@ class ConnectFour:
 #   - mutate: slightly alters weights for exploration
 #   - fitness: measures how effective a genome is
 #   - evolve: runs full evolutionary cycle and visualizes progress
+#   - save_checkpoint / load_checkpoint: persist evolve() state
+#   - plot_scores: draws the learning curve (imports matplotlib lazily)
 # -----------------------------------------------------------
 
 def generate_random_genome():
@@ -221,16 +225,80 @@ def fitness(game, genome):
     game.center_control_moves = genome['center_control']
     return game.evaluate_board('X')
 
+# Checkpoints hold everything evolve() needs to pick up where it
+# stopped: the next generation index, the current population, the
+# best score history and the state of the `random` module. They are
+# written to a temporary file and renamed into place, so a run that
+# is killed mid-write never leaves a truncated checkpoint behind.
+
+def save_checkpoint(path, generation, population, best_scores):
+    state = {
+        'generation': generation,
+        'population': population,
+        'best_scores': best_scores,
+        'rng_state': random.getstate(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path):
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    random.setstate(state['rng_state'])
+    return state['generation'], state['population'], state['best_scores']
+
+
+# matplotlib is only imported here, so headless runs (and every
+# module that imports this one) never pay its startup cost.
+# With `filename` the figure is saved instead of shown.
+
+def plot_scores(best_scores, filename=None):
+    import matplotlib
+    if filename is not None:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.plot(best_scores)
+    plt.title("Fitness Improvement over Generations")
+    plt.xlabel("Generation")
+    plt.ylabel("Best Fitness Score")
+    if filename is not None:
+        plt.savefig(filename)
+        plt.close()
+    else:
+        plt.show()
+
+
 # The evolve() function runs multiple generations of genomes.
 # It keeps the best-performing half of the population (parents),
 # breeds new generations through crossover and mutation,
 # and tracks the best score per generation using matplotlib.
-
-def evolve(game, generations=20, population_size=10, mutation_rate=0.1):
-    population = [generate_random_genome() for _ in range(population_size)]
-    best_scores = []
-
-    for gen in range(generations):
+# If `checkpoint_path` is given, the state is saved after every
+# generation; with `resume=True` an existing checkpoint at that
+# path is loaded first and evolution continues from it.
+
+def evolve(game, generations=20, population_size=10, mutation_rate=0.1,
+           checkpoint_path=None, resume=False, plot=True, plot_file=None):
+    start_gen = 0
+    if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+        start_gen, population, best_scores = load_checkpoint(checkpoint_path)
+        print(f"Resuming from generation {start_gen} ({checkpoint_path})")
+    else:
+        population = [generate_random_genome() for _ in range(population_size)]
+        best_scores = []
+
+    for gen in range(start_gen, generations):
         scores = [(genome, fitness(game, genome)) for genome in population]
         scores.sort(key=lambda x: x[1], reverse=True)
 
@@ -249,11 +317,11 @@ def evolve(game, generations=20, population_size=10, mutation_rate=0.1):
 
         population = next_gen
 
-    plt.plot(best_scores)
-    plt.title("Fitness Improvement over Generations")
-    plt.xlabel("Generation")
-    plt.ylabel("Best Fitness Score")
-    plt.show()
+        if checkpoint_path is not None:
+            save_checkpoint(checkpoint_path, gen + 1, population, best_scores)
+
+    if plot or plot_file is not None:
+        plot_scores(best_scores, filename=plot_file)
 
     best_genome = max(population, key=lambda g: fitness(game, g))
     return best_genome
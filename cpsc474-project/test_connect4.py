@@ -1,5 +1,11 @@
+import os
+import random
+import subprocess
+import sys
+import tempfile
 import time
 from connect4 import ConnectFourExtended
+from play_genetic import ConnectFour as GeneticConnectFour, evolve
 
 print("=== Test: Connect Four ===")
 
@@ -16,6 +22,33 @@ def test_multiple_games(num_games=3):
     game.play(num_games=num_games)
     print("Multiple games comparison completed.\n")
 
+def test_import_skips_matplotlib():
+    print("=== Test: Import Without Matplotlib ===")
+    code = "import sys, connect4; print('matplotlib' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert output.strip() == "False"
+    print("Import test completed.\n")
+
+def test_evolve_resume():
+    print("=== Test: Evolve Checkpoint/Resume ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = os.path.join(tmp, "evolve.ckpt")
+
+        random.seed(474)
+        full_run = evolve(GeneticConnectFour(), generations=6, plot=False)
+
+        # Stop after 3 generations, then resume from the checkpoint
+        random.seed(474)
+        evolve(GeneticConnectFour(), generations=3, checkpoint_path=checkpoint, plot=False)
+        random.seed(0)  # Resuming must restore the RNG state
+        resumed_run = evolve(GeneticConnectFour(), generations=6, checkpoint_path=checkpoint,
+                             resume=True, plot=False)
+
+        assert resumed_run == full_run
+        assert os.listdir(tmp) == ["evolve.ckpt"]
+    print("Resume test completed.\n")
+
 if __name__ == "__main__":
     # Run one automated test game
     test_single_game()
@@ -23,3 +56,7 @@ if __name__ == "__main__":
     # Then run multiple comparisons
     test_multiple_games(num_games=5)
 
+    # Headless startup and checkpoint/resume
+    test_import_skips_matplotlib()
+    test_evolve_resume()
+